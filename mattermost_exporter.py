@@ -6,67 +6,212 @@ A tool to export and import Mattermost webhooks and bot data using the Mattermos
 """
 
 import argparse
+import base64
+import gzip
 import json
 import logging
 import os
 import sys
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
+
+# urllib3 can only decode brotli responses when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Conditional GET cache (ETag plus gzipped body), keyed by request URL
+CACHE_FILE = '.mattermost_cache.json'
+
+# Server-generated fields stripped from items before they are re-created
+_INCOMING_DROP = frozenset({'id', 'create_at', 'update_at', 'delete_at'})
+_OUTGOING_DROP = _INCOMING_DROP | {'token'}
+_BOT_DROP = frozenset({'user_id', 'create_at', 'update_at', 'delete_at', 'owner_id'})
+
+# Maximum number of create requests in flight at once during import
+IMPORT_CONCURRENCY = 10
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class MattermostClient:
     """Client for interacting with the Mattermost REST API"""
     
+    _session: Optional[requests.Session] = None
+    
     def __init__(self, server_url: str, token: str):
         self.server_url = server_url.rstrip('/')
         self.api_url = f"{self.server_url}/api/v4"
         self.token = token
-        self.session = requests.Session()
-        
-        # Setup retry strategy
-        retry_strategy = Retry(
-            total=3,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
-        # Set headers
-        self.session.headers.update({
-            'Authorization': f'Bearer {token}',
-            'Content-Type': 'application/json'
-        })
-    
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make GET request to API endpoint"""
+        self.session = self.get_session()
+        
+        # Auth is sent per request so clients with different tokens can share the pool
+        self.headers = {'Authorization': f'Bearer {token}'}
+        self.logger = logging.getLogger(__name__)
+        self._encoding_logged = set()
+        self._cache: Optional[Dict[str, Dict[str, str]]] = None
+    
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        """Return the session shared by all clients, creating it on first use"""
+        if cls._session is None:
+            session = requests.Session()
+            
+            # Setup retry strategy. POST is left out since creating integrations is not idempotent.
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["HEAD", "GET", "OPTIONS"],
+                respect_retry_after_header=True
+            )
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry_strategy)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            
+            # Set headers
+            session.headers.update({
+                'Content-Type': 'application/json',
+                'Accept-Encoding': ACCEPT_ENCODING
+            })
+            cls._session = session
+        return cls._session
+    
+    def _parse(self, response: requests.Response) -> Any:
+        """Decode a JSON response body (the API always sends UTF-8)"""
+        try:
+            return _loads(response.content)
+        except ValueError:
+            # Let requests raise its own JSONDecodeError, which callers handle as a RequestException
+            return response.json()
+    
+    def _load_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load the conditional GET cache from disk, once per client"""
+        if self._cache is None:
+            try:
+                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+            except (IOError, ValueError):
+                self._cache = {}
+            if not isinstance(self._cache, dict):
+                self._cache = {}
+        return self._cache
+    
+    def _cache_entry(self, key: str) -> Optional[Dict[str, str]]:
+        """Return the cache entry for key, treating malformed entries as a miss"""
+        entry = self._load_cache().get(key)
+        if (isinstance(entry, dict) and isinstance(entry.get('etag'), str)
+                and isinstance(entry.get('body'), str)):
+            return entry
+        return None
+    
+    def _store_cache(self, key: str, etag: str, body: bytes):
+        """Store a response body under its ETag and persist the cache"""
+        cache = self._load_cache()
+        cache[key] = {
+            'etag': etag,
+            'body': base64.b64encode(gzip.compress(body)).decode('ascii')
+        }
+        try:
+            # Cached bodies can contain webhook tokens, so keep the file private
+            fd = os.open(CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # The mode above only applies on creation, so also tighten an existing file
+            os.chmod(CACHE_FILE, 0o600)
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except IOError as e:
+            self.logger.warning(f"Failed to write cache file {CACHE_FILE}: {e}")
+    
+    def get(self, endpoint: str, params: Optional[Dict] = None, cached: bool = False) -> Dict:
+        """Make GET request to API endpoint, revalidating against the ETag cache if cached is set"""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
-        response = self.session.get(url, params=params)
+        headers = self.headers
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        entry = None
+        if cached:
+            entry = self._cache_entry(cache_key)
+            if entry:
+                headers = {**self.headers, 'If-None-Match': entry['etag']}
+        
+        response = self.session.get(url, params=params, headers=headers)
         response.raise_for_status()
-        return response.json()
+        # users/me is too small to be compressed, so report each endpoint once
+        if endpoint not in self._encoding_logged:
+            self._encoding_logged.add(endpoint)
+            self.logger.debug(f"Response encoding for {endpoint}: "
+                              f"{response.headers.get('Content-Encoding', 'identity')}")
+        
+        if entry and response.status_code == 304:
+            try:
+                data = _loads(gzip.decompress(base64.b64decode(entry['body'])))
+            except (KeyError, TypeError, ValueError, OSError, EOFError, zlib.error):
+                # The cache is only an optimisation: drop the bad entry and fetch in full
+                self.logger.debug(f"Discarding unreadable cached response for {endpoint}")
+                self._load_cache().pop(cache_key, None)
+                return self.get(endpoint, params, cached=True)
+            self.logger.debug(f"Using cached response for {endpoint}")
+            return data
+        
+        data = self._parse(response)
+        if cached and response.headers.get('ETag'):
+            self._store_cache(cache_key, response.headers['ETag'], response.content)
+        return data
     
     def post(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make POST request to API endpoint"""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
-        response = self.session.post(url, json=data)
+        response = self.session.post(url, json=data, headers=self.headers)
+        response.raise_for_status()
+        return self._parse(response)
+    
+    def post_raw(self, endpoint: str, payload: bytes) -> Dict:
+        """Make POST request to API endpoint with an already serialized JSON body"""
+        url = f"{self.api_url}/{endpoint.lstrip('/')}"
+        response = self.session.post(url, data=payload, headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        return self._parse(response)
     
     def put(self, endpoint: str, data: Optional[Dict] = None) -> Dict:
         """Make PUT request to API endpoint"""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
-        response = self.session.put(url, json=data)
+        response = self.session.put(url, json=data, headers=self.headers)
         response.raise_for_status()
-        return response.json()
+        return self._parse(response)
     
     def delete(self, endpoint: str) -> bool:
         """Make DELETE request to API endpoint"""
         url = f"{self.api_url}/{endpoint.lstrip('/')}"
-        response = self.session.delete(url)
+        response = self.session.delete(url, headers=self.headers)
         response.raise_for_status()
         return response.status_code == 200
 
@@ -78,55 +223,81 @@ class MattermostExporter:
         self.client = client
         self.logger = logging.getLogger(__name__)
     
+    def _post_items(self, endpoint: str, items: List[bytes], desc: str) -> List[Optional[Exception]]:
+        """POST serialized items to endpoint concurrently, returning each item's error (or None) in input order"""
+        def post_one(payload: bytes) -> Optional[Exception]:
+            try:
+                self.client.post_raw(endpoint, payload)
+                return None
+            except requests.exceptions.RequestException as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=IMPORT_CONCURRENCY) as executor:
+            results = executor.map(post_one, items)
+            if tqdm is not None:
+                results = tqdm(results, total=len(items), desc=desc, unit='item', leave=False)
+            return list(results)
+    
+    def _write_report(self, lines: List[Tuple[str, bool]], dry_run: bool):
+        """Write an import section's (line, is_plain_success) status lines with a single write.
+        
+        Dry runs list every item as a preview. Real imports skip plain successes when
+        tqdm showed a progress bar; failures and renames are always listed.
+        """
+        show_successes = dry_run or tqdm is None
+        text = "".join(f"{line}\n" for line, plain_success in lines
+                       if show_successes or not plain_success)
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
     def export_incoming_webhooks(self) -> List[Dict]:
-        """Export all incoming webhooks"""
+        """Fetch all incoming webhooks"""
         self.logger.info("Exporting incoming webhooks...")
-        try:
-            webhooks = self.client.get("hooks/incoming")
-            self.logger.info(f"Found {len(webhooks)} incoming webhooks")
-            print(f"📥 Found {len(webhooks)} incoming webhook(s)")
-            for webhook in webhooks:
-                name = webhook.get('display_name', 'Unnamed')
-                print(f"  ✓ {name}")
-            return webhooks
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to export incoming webhooks: {e}")
-            print(f"📥 ✗ Failed to export incoming webhooks: {e}")
-            return []
+        webhooks = self.client.get("hooks/incoming")
+        self.logger.info(f"Found {len(webhooks)} incoming webhooks")
+        return webhooks
     
     def export_outgoing_webhooks(self) -> List[Dict]:
-        """Export all outgoing webhooks"""
+        """Fetch all outgoing webhooks"""
         self.logger.info("Exporting outgoing webhooks...")
-        try:
-            webhooks = self.client.get("hooks/outgoing")
-            self.logger.info(f"Found {len(webhooks)} outgoing webhooks")
-            print(f"📤 Found {len(webhooks)} outgoing webhook(s)")
-            for webhook in webhooks:
-                name = webhook.get('display_name', 'Unnamed')
-                print(f"  ✓ {name}")
-            return webhooks
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to export outgoing webhooks: {e}")
-            print(f"📤 ✗ Failed to export outgoing webhooks: {e}")
-            return []
+        webhooks = self.client.get("hooks/outgoing")
+        self.logger.info(f"Found {len(webhooks)} outgoing webhooks")
+        return webhooks
     
     def export_bots(self) -> List[Dict]:
-        """Export all bot accounts"""
+        """Fetch all bot accounts"""
         self.logger.info("Exporting bot accounts...")
+        bots = self.client.get("bots")
+        self.logger.info(f"Found {len(bots)} bot accounts")
+        return bots
+    
+    def _collect_export(self, future: Future, icon: str, section: str, noun: str,
+                        label: Callable[[Dict], str]) -> List[Dict]:
+        """Wait for an export and print its summary, returning [] if it failed"""
         try:
-            bots = self.client.get("bots")
-            self.logger.info(f"Found {len(bots)} bot accounts")
-            print(f"🤖 Found {len(bots)} bot account(s)")
-            for bot in bots:
-                name = bot.get('username', 'Unnamed')
-                display_name = bot.get('display_name', '')
-                name_display = f"{name} ({display_name})" if display_name and display_name != name else name
-                print(f"  ✓ {name_display}")
-            return bots
+            items = future.result()
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Failed to export bot accounts: {e}")
-            print(f"🤖 ✗ Failed to export bot accounts: {e}")
+            self.logger.error(f"Failed to export {section}: {e}")
+            print(f"{icon} ✗ Failed to export {section}: {e}")
             return []
+        
+        print(f"{icon} Found {len(items)} {noun}")
+        for item in items:
+            print(f"  ✓ {label(item)}")
+        return items
+    
+    @staticmethod
+    def _webhook_label(webhook: Dict) -> str:
+        """Display name of a webhook"""
+        return webhook.get('display_name', 'Unnamed')
+    
+    @staticmethod
+    def _bot_label(bot: Dict) -> str:
+        """Username of a bot, with its display name when it differs"""
+        name = bot.get('username', 'Unnamed')
+        display_name = bot.get('display_name', '')
+        return f"{name} ({display_name})" if display_name and display_name != name else name
     
     
     def export_all(self, output_file: str):
@@ -144,16 +315,26 @@ class MattermostExporter:
             print("Please check your MATTERMOST_SERVER_URL and MATTERMOST_TOKEN")
             sys.exit(1)
         
-        export_data = {
-            'metadata': {
-                'export_date': datetime.now().isoformat(),
-                'server_url': self.client.server_url,
-                'version': '1.0'
-            },
-            'incoming_webhooks': self.export_incoming_webhooks(),
-            'outgoing_webhooks': self.export_outgoing_webhooks(),
-            'bots': self.export_bots()
-        }
+        # The three exports are independent, so fetch them concurrently. Results are
+        # printed here on the main thread, in a fixed order, so their output never mixes.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            incoming = executor.submit(self.export_incoming_webhooks)
+            outgoing = executor.submit(self.export_outgoing_webhooks)
+            bots = executor.submit(self.export_bots)
+            
+            export_data = {
+                'metadata': {
+                    'export_date': datetime.now().isoformat(),
+                    'server_url': self.client.server_url,
+                    'version': '1.0'
+                },
+                'incoming_webhooks': self._collect_export(
+                    incoming, "📥", "incoming webhooks", "incoming webhook(s)", self._webhook_label),
+                'outgoing_webhooks': self._collect_export(
+                    outgoing, "📤", "outgoing webhooks", "outgoing webhook(s)", self._webhook_label),
+                'bots': self._collect_export(
+                    bots, "🤖", "bot accounts", "bot account(s)", self._bot_label)
+            }
         
         # Check if any exports failed completely
         if (not export_data['incoming_webhooks'] and 
@@ -169,8 +350,8 @@ class MattermostExporter:
                 sys.exit(1)
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                self._stream_export(f, export_data)
             
             total_items = (len(export_data['incoming_webhooks']) + 
                           len(export_data['outgoing_webhooks']) + 
@@ -184,6 +365,17 @@ class MattermostExporter:
             print(f"✗ Export failed: {e}")
             sys.exit(1)
     
+    def _stream_export(self, f, export_data: Dict):
+        """Write export data one item per line, so only a single item is serialized at a time"""
+        f.write(b'{"metadata":' + _dumps(export_data['metadata']))
+        for section in ('incoming_webhooks', 'outgoing_webhooks', 'bots'):
+            f.write(b',\n"' + section.encode('ascii') + b'":[')
+            for i, item in enumerate(export_data[section]):
+                f.write(b'\n' if i == 0 else b',\n')
+                f.write(_dumps(item))
+            f.write(b'\n]')
+        f.write(b'\n}\n')
+    
     def import_incoming_webhooks(self, webhooks: List[Dict], dry_run: bool = False):
         """Import incoming webhooks"""
         if not webhooks:
@@ -196,54 +388,62 @@ class MattermostExporter:
         existing_webhooks = []
         if not dry_run:
             try:
-                existing_webhooks = self.client.get("hooks/incoming")
+                existing_webhooks = self.client.get("hooks/incoming", cached=True)
             except requests.exceptions.RequestException:
                 pass
+        existing_names = frozenset(e.get('display_name') for e in existing_webhooks)
+        import_note = f"[Imported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
         
-        success_count = 0
+        names = []
+        renamed = []
+        payloads = []
         for webhook in webhooks:
             original_name = webhook.get('display_name', 'Unnamed')
             name = original_name
             
-            try:
-                # Remove server-generated fields
-                webhook_data = {k: v for k, v in webhook.items() 
-                               if k not in ['id', 'create_at', 'update_at', 'delete_at']}
-                
-                # Check for existing webhook with same name
-                duplicate_found = False
-                if not dry_run:
-                    for existing in existing_webhooks:
-                        if existing.get('display_name') == original_name:
-                            duplicate_found = True
-                            break
-                
-                # Modify webhook data for import
-                if duplicate_found:
-                    webhook_data['display_name'] = f"{original_name} (imported)"
-                    name = webhook_data['display_name']
-                
-                # Add import note to description
-                import_note = f"[Imported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
-                existing_desc = webhook_data.get('description', '')
-                if existing_desc:
-                    webhook_data['description'] = f"{existing_desc}\n\n{import_note}"
-                else:
-                    webhook_data['description'] = import_note
-                
-                if not dry_run:
-                    self.client.post("hooks/incoming", webhook_data)
-                
-                success_count += 1
-                status_msg = f"  ✓ {name}"
-                if duplicate_found:
-                    status_msg += " (renamed to avoid conflict)"
-                print(status_msg)
-                self.logger.debug(f"Imported incoming webhook: {name}")
-                
-            except requests.exceptions.RequestException as e:
-                print(f"  ✗ {name} - {e}")
-                self.logger.error(f"Failed to import incoming webhook {name}: {e}")
+            # Remove server-generated fields
+            webhook_data = {k: v for k, v in webhook.items() if k not in _INCOMING_DROP}
+            
+            # Check for existing webhook with same name
+            duplicate_found = original_name in existing_names
+            
+            # Modify webhook data for import
+            if duplicate_found:
+                webhook_data['display_name'] = f"{original_name} (imported)"
+                name = webhook_data['display_name']
+            
+            # Add import note to description
+            existing_desc = webhook_data.get('description', '')
+            if existing_desc:
+                webhook_data['description'] = f"{existing_desc}\n\n{import_note}"
+            else:
+                webhook_data['description'] = import_note
+            
+            names.append(name)
+            renamed.append(duplicate_found)
+            payloads.append(_dumps(webhook_data))
+        
+        if dry_run:
+            errors = [None] * len(payloads)
+        else:
+            errors = self._post_items("hooks/incoming", payloads, "Incoming")
+        
+        success_count = 0
+        lines = []
+        for name, duplicate_found, error in zip(names, renamed, errors):
+            if error is not None:
+                lines.append((f"  ✗ {name} - {error}", False))
+                self.logger.error(f"Failed to import incoming webhook {name}: {error}")
+                continue
+            
+            success_count += 1
+            if duplicate_found:
+                lines.append((f"  ✓ {name} (renamed to avoid conflict)", False))
+            else:
+                lines.append((f"  ✓ {name}", True))
+            self.logger.debug(f"Imported incoming webhook: {name}")
+        
+        self._write_report(lines, dry_run)
         
         self.logger.info(f"Successfully imported {success_count}/{len(webhooks)} incoming webhooks")
         return success_count
@@ -260,54 +460,62 @@ class MattermostExporter:
         existing_webhooks = []
         if not dry_run:
             try:
-                existing_webhooks = self.client.get("hooks/outgoing")
+                existing_webhooks = self.client.get("hooks/outgoing", cached=True)
             except requests.exceptions.RequestException:
                 pass
+        existing_names = frozenset(e.get('display_name') for e in existing_webhooks)
+        import_note = f"[Imported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
         
-        success_count = 0
+        names = []
+        renamed = []
+        payloads = []
         for webhook in webhooks:
             original_name = webhook.get('display_name', 'Unnamed')
             name = original_name
             
-            try:
-                # Remove server-generated fields
-                webhook_data = {k: v for k, v in webhook.items() 
-                               if k not in ['id', 'create_at', 'update_at', 'delete_at', 'token']}
-                
-                # Check for existing webhook with same name
-                duplicate_found = False
-                if not dry_run:
-                    for existing in existing_webhooks:
-                        if existing.get('display_name') == original_name:
-                            duplicate_found = True
-                            break
-                
-                # Modify webhook data for import
-                if duplicate_found:
-                    webhook_data['display_name'] = f"{original_name} (imported)"
-                    name = webhook_data['display_name']
-                
-                # Add import note to description
-                import_note = f"[Imported on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]"
-                existing_desc = webhook_data.get('description', '')
-                if existing_desc:
-                    webhook_data['description'] = f"{existing_desc}\n\n{import_note}"
-                else:
-                    webhook_data['description'] = import_note
-                
-                if not dry_run:
-                    self.client.post("hooks/outgoing", webhook_data)
-                
-                success_count += 1
-                status_msg = f"  ✓ {name}"
-                if duplicate_found:
-                    status_msg += " (renamed to avoid conflict)"
-                print(status_msg)
-                self.logger.debug(f"Imported outgoing webhook: {name}")
-                
-            except requests.exceptions.RequestException as e:
-                print(f"  ✗ {name} - {e}")
-                self.logger.error(f"Failed to import outgoing webhook {name}: {e}")
+            # Remove server-generated fields
+            webhook_data = {k: v for k, v in webhook.items() if k not in _OUTGOING_DROP}
+            
+            # Check for existing webhook with same name
+            duplicate_found = original_name in existing_names
+            
+            # Modify webhook data for import
+            if duplicate_found:
+                webhook_data['display_name'] = f"{original_name} (imported)"
+                name = webhook_data['display_name']
+            
+            # Add import note to description
+            existing_desc = webhook_data.get('description', '')
+            if existing_desc:
+                webhook_data['description'] = f"{existing_desc}\n\n{import_note}"
+            else:
+                webhook_data['description'] = import_note
+            
+            names.append(name)
+            renamed.append(duplicate_found)
+            payloads.append(_dumps(webhook_data))
+        
+        if dry_run:
+            errors = [None] * len(payloads)
+        else:
+            errors = self._post_items("hooks/outgoing", payloads, "Outgoing")
+        
+        success_count = 0
+        lines = []
+        for name, duplicate_found, error in zip(names, renamed, errors):
+            if error is not None:
+                lines.append((f"  ✗ {name} - {error}", False))
+                self.logger.error(f"Failed to import outgoing webhook {name}: {error}")
+                continue
+            
+            success_count += 1
+            if duplicate_found:
+                lines.append((f"  ✓ {name} (renamed to avoid conflict)", False))
+            else:
+                lines.append((f"  ✓ {name}", True))
+            self.logger.debug(f"Imported outgoing webhook: {name}")
+        
+        self._write_report(lines, dry_run)
         
         self.logger.info(f"Successfully imported {success_count}/{len(webhooks)} outgoing webhooks")
         return success_count
@@ -320,29 +528,36 @@ class MattermostExporter:
         self.logger.info(f"Importing {len(bots)} bot accounts (dry_run={dry_run})")
         print(f"🤖 Importing {len(bots)} bot account(s)...")
         
-        success_count = 0
+        names = []
+        payloads = []
         for bot in bots:
-            name = bot.get('username', 'Unnamed')
-            try:
-                # Remove server-generated fields and prepare bot data
-                bot_data = {k: v for k, v in bot.items() 
-                           if k not in ['user_id', 'create_at', 'update_at', 'delete_at', 'owner_id']}
-                
-                if not dry_run:
-                    self.client.post("bots", bot_data)
-                
-                success_count += 1
-                print(f"  ✓ {name}")
-                self.logger.debug(f"Imported bot: {name}")
-                
-            except requests.exceptions.RequestException as e:
-                error_msg = str(e)
+            names.append(bot.get('username', 'Unnamed'))
+            # Remove server-generated fields and prepare bot data
+            payloads.append(_dumps({k: v for k, v in bot.items() if k not in _BOT_DROP}))
+        
+        if dry_run:
+            errors = [None] * len(payloads)
+        else:
+            errors = self._post_items("bots", payloads, "Bots")
+        
+        success_count = 0
+        lines = []
+        for name, error in zip(names, errors):
+            if error is not None:
+                error_msg = str(error)
                 if "403" in error_msg:
                     error_msg = "Insufficient permissions to create bots"
                 elif "409" in error_msg:
                     error_msg = "Bot already exists"
-                print(f"  ✗ {name} - {error_msg}")
-                self.logger.error(f"Failed to import bot {name}: {e}")
+                lines.append((f"  ✗ {name} - {error_msg}", False))
+                self.logger.error(f"Failed to import bot {name}: {error}")
+                continue
+            
+            success_count += 1
+            lines.append((f"  ✓ {name}", True))
+            self.logger.debug(f"Imported bot: {name}")
+        
+        self._write_report(lines, dry_run)
         
         self.logger.info(f"Successfully imported {success_count}/{len(bots)} bot accounts")
         return success_count
@@ -353,8 +568,8 @@ class MattermostExporter:
         self.logger.info(f"Starting import from {input_file} (dry_run={dry_run})")
         
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(input_file, 'rb') as f:
+                import_data = _loads(f.read())
         except (IOError, json.JSONDecodeError) as e:
             self.logger.error(f"Failed to read import file: {e}")
             print(f"✗ Import failed: {e}")
@@ -368,18 +583,23 @@ class MattermostExporter:
                 print(f"✗ Import failed: Invalid file format")
                 sys.exit(1)
         
+        total_items = (len(import_data['incoming_webhooks']) + 
+                      len(import_data['outgoing_webhooks']) + 
+                      len(import_data['bots']))
+        if not total_items:
+            self.logger.info("Nothing to import: all sections are empty")
+            print("✓ Nothing to import")
+            return
+        
         if dry_run:
             print("🔍 Dry run mode - no changes will be made")
         
-        # Import each type
+        # Import each type; empty sections return before touching the server
         incoming_count = self.import_incoming_webhooks(import_data['incoming_webhooks'], dry_run)
         outgoing_count = self.import_outgoing_webhooks(import_data['outgoing_webhooks'], dry_run)
         bot_count = self.import_bots(import_data['bots'], dry_run)
         
         total_imported = incoming_count + outgoing_count + bot_count
-        total_items = (len(import_data['incoming_webhooks']) + 
-                      len(import_data['outgoing_webhooks']) + 
-                      len(import_data['bots']))
         
         if dry_run:
             print(f"🔍 Dry run completed: {total_imported}/{total_items} items would be imported")